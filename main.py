@@ -1,86 +1,400 @@
 import firebase_admin
 from firebase_admin import credentials, db
+import google.auth.exceptions
+import google.auth.transport.requests
+import aiohttp
+import asyncio
+import io
+import orjson
 import streamlit as st
 import altair as alt
 from datetime import datetime, timezone, timedelta
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import queue
+import threading
 import time
-import json
+import weakref
 
-# Global DataFrame to store Firebase data
-df = None
+TIME_FORMAT = "%H:%M:%S %d/%m/%Y"
+CHART_DATASET = "temperature"
+# How much history each session keeps in memory
+HISTORY_WINDOW = timedelta(hours=24)
+# The chart title and highest/lowest metrics only cover HISTORY_WINDOW, so say so
+HISTORY_LABEL = f"last {int(HISTORY_WINDOW.total_seconds() // 3600)} h"
+# The chart is ~800 px wide, so more points than this add nothing visible
+CHART_POINTS = 2000
+# Older downloads are split into this many concurrent REST requests
+DOWNLOAD_REQUESTS = 8
+# Seconds before a REST request to Firebase is abandoned
+REST_TIMEOUT = 30
 
-def format_timestamp(unix_timestamp):
+FOOTER_HTML = """
+    <style>
+        /* Footer container */
+        .footer {
+            width: 100%;
+            background-color: #252525;
+            padding: 1rem;
+            text-align: center;
+            box-shadow: 0 -1px 5px rgba(0,0,0,0.1);
+            font-size: clamp(12px, 1vw, 16px);  /* Responsive font size */
+            color: #666;
+            position: fixed;
+            bottom: 0;
+            left: 0;
+        }
+
+        /* Footer text */
+        .footer-text {
+            color: #FFFFFF;
+            font-weight: 400;
+            font-size: clamp(16px, 1vw, 14px); /* Responsive font size */
+        }
+    </style>
+
+    <div class="footer">
+        <div class="footer-text">
+            From Bolzaneto with ❤️!
+        </div>
+    </div>
+    """
+
+def format_timestamp(unix_timestamp, _fromtimestamp=datetime.fromtimestamp, _utc=timezone.utc, _format=TIME_FORMAT):
     """Convert Unix timestamp to formatted datetime string (hh:mm:ss dd/mm/yyyy)."""
-    dt = datetime.fromtimestamp(int(unix_timestamp), tz=timezone.utc)
-    formatted_time = dt.strftime("%H:%M:%S %d/%m/%Y")
-    return formatted_time, dt
-
-def initialize_firebase():
-    """Initialize Firebase connection if not already initialized."""
-    if not firebase_admin._apps:
-        try:
-            # Load Firebase credentials from st.secrets
-            cert_data = dict(st.secrets["firebase"]["CERT"])
-
-            # Convert CERT data to JSON string (if needed)
-            cert_json = json.dumps(cert_data, indent=4)
-
-            # Save the JSON data temporarily for the credentials
-            cert_dict = json.loads(cert_json)
-
-            # Initialize the Firebase app
-            cred = credentials.Certificate(cert_dict)
-
-            # Initialize the Firebase app with the database URL
-            firebase_admin.initialize_app(cred, {
-                'databaseURL': st.secrets["ADRESS"]["URL"]
-            })
-            return True
-        except Exception as e:
-            st.error(f"Firebase initialization error: {str(e)}")
-        return False 
-
-def fetch_temperature_data():
-    """Fetch temperature data from Firebase and process it."""
-    ref = db.reference('/TemperatureData')
-    temp_data = ref.get()
-    
-    if temp_data:
-        data = []
-        for unix, temp in sorted(temp_data.items(), key=lambda x: int(x[0])):
-            formatted_time, dt = format_timestamp(unix)
-            data.append({
-                "Timestamp": dt,
-                "FormattedTime": formatted_time,
-                "Temperature": temp
-            })
-        
-        return pd.DataFrame(data)
-    return None
-
-def create_temperature_chart(df):
-    """Create Altair chart from temperature DataFrame."""
-    return alt.Chart(df).mark_line().encode(
+    # The defaults bind the lookups once, so each call only reads locals
+    dt = _fromtimestamp(int(unix_timestamp), tz=_utc)
+    return dt.strftime(_format), dt
+
+@st.cache_resource
+def get_firebase_app():
+    """Initialize the Firebase app once per server process."""
+    if firebase_admin._apps:
+        return firebase_admin.get_app()
+
+    # Certificate accepts the mapping from st.secrets directly
+    cred = credentials.Certificate(dict(st.secrets["firebase"]["CERT"]))
+    return firebase_admin.initialize_app(cred, {
+        'databaseURL': st.secrets["ADRESS"]["URL"]
+    })
+
+@st.cache_resource
+def get_temperature_ref():
+    """Return the /TemperatureData reference shared by all sessions."""
+    return db.reference('/TemperatureData')
+
+class FirebaseRestClient:
+    """Query the Realtime Database REST API from a background asyncio loop.
+
+    A single aiohttp session is reused for every request so connections are kept alive.
+    """
+
+    def __init__(self, app):
+        self._url = app.options.get('databaseURL').rstrip('/')
+        self._credential = app.credential.get_credential()
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._session = self._run(self._open_session())
+
+    async def _open_session(self):
+        return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REST_TIMEOUT))
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _access_token(self):
+        with self._lock:
+            if not self._credential.valid:
+                self._credential.refresh(google.auth.transport.requests.Request())
+            return self._credential.token
+
+    async def _fetch_range(self, start_key, end_key, headers):
+        params = {'orderBy': '"$key"'}
+        if start_key is not None:
+            params['startAt'] = f'"{start_key}"'
+        if end_key is not None:
+            params['endAt'] = f'"{end_key}"'
+
+        async with self._session.get(f'{self._url}/TemperatureData.json', params=params, headers=headers) as response:
+            response.raise_for_status()
+            # Decode the raw bytes directly; orjson is much faster than the stdlib json
+            return orjson.loads(await response.read()) or {}
+
+    async def _fetch_ranges(self, ranges, headers):
+        return await asyncio.gather(*(self._fetch_range(start_key, end_key, headers) for start_key, end_key in ranges))
+
+    def fetch_ranges(self, ranges):
+        """Fetch (start_key, end_key) ranges concurrently and merge them into one dict.
+
+        Either bound may be None to leave that side of the range open.
+        """
+        headers = {'Authorization': f'Bearer {self._access_token()}'}
+        temp_data = {}
+        for result in self._run(self._fetch_ranges(ranges, headers)):
+            temp_data.update(result)
+        return temp_data
+
+@st.cache_resource
+def get_rest_client():
+    """Start the REST client shared by all sessions."""
+    return FirebaseRestClient(get_firebase_app())
+
+def build_temperature_frame(temp_data):
+    """Build a time-ordered DataFrame from a {unix: temperature} dict."""
+    if not temp_data:
+        return None
+
+    # Convert the whole dict at once instead of formatting row by row
+    keys = np.fromiter(temp_data.keys(), dtype=np.int64, count=len(temp_data))
+    temps = np.fromiter(temp_data.values(), dtype=np.float32, count=len(temp_data))
+    # The REST API does not preserve key order, so sort unless the keys already ascend
+    if (keys[1:] < keys[:-1]).any():
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        temps = temps[order]
+
+    # Arrow wraps the NumPy buffers directly, and the unix keys already are second timestamps
+    batch = pa.RecordBatch.from_arrays([
+        pa.array(keys, type=pa.timestamp('s', tz='UTC')),
+        pa.array(temps, type=pa.float32())
+    ], names=["Timestamp", "Temperature"])
+    return batch.to_pandas(zero_copy_only=False)
+
+def fetch_new_temperature_data(last_key=None):
+    """Fetch temperature data recorded after last_key from Firebase as a {unix: temperature} dict."""
+    start_key = None if last_key is None else last_key + 1
+    return get_rest_client().fetch_ranges([(start_key, None)])
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner="Fetching older temperature data...")
+def fetch_temperature_range(start_key, end_key):
+    """Fetch the data recorded between two unix keys as a DataFrame."""
+    bounds = np.linspace(start_key, end_key + 1, num=DOWNLOAD_REQUESTS + 1, dtype=np.int64)
+    ranges = [(int(low), int(high) - 1) for low, high in zip(bounds[:-1], bounds[1:]) if high > low]
+    return build_temperature_frame(get_rest_client().fetch_ranges(ranges))
+
+@st.cache_resource(ttl=1, show_spinner=False)
+def fetch_raw_temperature_data(latest_key):
+    """Fetch the last HISTORY_WINDOW of /TemperatureData once per latest key seen by the listener.
+
+    The dict is shared between sessions without copying, so it must not be mutated.
+    """
+    if latest_key is None:
+        # The listener has not seen a sample yet, so count the window back from now
+        latest_key = int(time.time())
+    return fetch_new_temperature_data(latest_key - int(HISTORY_WINDOW.total_seconds()))
+
+@st.cache_data(ttl=1, show_spinner=False)
+def load_temperature_history(latest_key):
+    """Build the DataFrame of all data recorded up to latest_key."""
+    return build_temperature_frame(fetch_raw_temperature_data(latest_key))
+
+class TemperatureListener:
+    """Stream /TemperatureData events from Firebase and fan them out to session queues."""
+
+    def __init__(self):
+        # Queues live in each session's state and drop out here once the session is gone
+        self._queues = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self.latest_key = None
+        self._registration = get_temperature_ref().listen(self._on_event)
+
+    def _on_event(self, event):
+        if event.path == '/':
+            # Snapshot or patch: a dict of {unix: temperature} children
+            children = event.data if isinstance(event.data, dict) else {}
+        else:
+            children = {event.path.strip('/'): event.data}
+
+        # An exception here would end the stream for every session, so skip
+        # anything that is not a unix key instead of raising
+        keys = {}
+        for unix in children:
+            try:
+                keys[unix] = int(unix)
+            except ValueError:
+                pass
+        if not keys:
+            return
+
+        with self._lock:
+            # listen() re-sends the whole node on every (re)connect; pass on only
+            # the samples after the newest one seen, or the last HISTORY_WINDOW at first
+            if self.latest_key is None:
+                floor = max(keys.values()) - int(HISTORY_WINDOW.total_seconds())
+            else:
+                floor = self.latest_key
+            self.latest_key = max(max(keys.values()), self.latest_key or 0)
+            queues = list(self._queues)
+
+        data = {unix: children[unix] for unix, key in keys.items() if key > floor}
+        if not data:
+            return
+        for events in queues:
+            events.put(data)
+
+    def subscribe(self):
+        """Return a queue that receives every new {unix: temperature} batch from now on."""
+        events = queue.Queue()
+        with self._lock:
+            self._queues.add(events)
+        return events
+
+@st.cache_resource
+def get_listener():
+    """Start a single Firebase listener shared by all sessions."""
+    return TemperatureListener()
+
+def read_temperature_events(events, last_key):
+    """Collect the queued stream events recorded after last_key."""
+    temp_data = {}
+    try:
+        data = events.get_nowait()
+        while True:
+            for unix, temp in data.items():
+                # Deletions arrive as None; keys older than last_key would break the time ordering
+                if temp is not None and (last_key is None or int(unix) > last_key):
+                    temp_data[unix] = temp
+
+            data = events.get_nowait()
+    except queue.Empty:
+        pass
+    return temp_data
+
+def append_temperature_data(state, new_df):
+    """Append newly recorded data to the DataFrame held in the session state."""
+    if new_df is None:
+        return False
+
+    state['last_key'] = int(new_df['Timestamp'].iloc[-1].timestamp())
+    if state['df'] is None:
+        df = new_df
+    else:
+        df = pd.concat([state['df'], new_df], ignore_index=True, copy=False)
+
+    # Drop everything older than HISTORY_WINDOW
+    cutoff = df['Timestamp'].iat[-1] - HISTORY_WINDOW
+    state['df'] = df.iloc[df['Timestamp'].searchsorted(cutoff):]
+    return True
+
+def create_temperature_chart():
+    """Create Altair chart reading from the named CHART_DATASET."""
+    return alt.Chart(alt.NamedData(name=CHART_DATASET)).mark_line().encode(
         x=alt.X('Timestamp:T', title='Time (UTC)', axis=alt.Axis(format='%H:%M')),
         y=alt.Y('Temperature:Q', title='Temperature (°C)'),
-        tooltip=['FormattedTime', 'Temperature']
+        # Vega formats the tooltip time in the browser
+        tooltip=[
+            alt.Tooltip('utcyearmonthdatehoursminutesseconds(Timestamp):T', title='Time (UTC)', format=TIME_FORMAT),
+            alt.Tooltip('Temperature:Q', format='.2f')
+        ]
     ).properties(
-        title="Real-Time Temperature Data",
+        title=f"Real-Time Temperature Data ({HISTORY_LABEL})",
         width=800,
         height=400
     )
 
+def draw_temperature_chart(state, df):
+    """Draw every stride-th row of df and return the chart handle for add_rows updates."""
+    stride = max(1, len(df) // CHART_POINTS)
+    display_df = df.iloc[::stride]
+    state['chart_stride'] = stride
+    state['chart_points'] = len(display_df)
+    # Rows received since the last one drawn
+    state['chart_phase'] = (len(df) - 1) % stride
+
+    # Naming the dataset lets later updates send only the new rows
+    spec = create_temperature_chart().to_dict()
+    spec['datasets'] = {CHART_DATASET: display_df}
+    return st.vega_lite_chart(spec, use_container_width=True)
+
+def update_temperature_chart(state, chart, new_df):
+    """Append new_df to the chart at its stride; return False once the chart needs a redraw."""
+    stride = state['chart_stride']
+    phase = state['chart_phase']
+    new_points = new_df.iloc[(stride - phase - 1) % stride::stride]
+    state['chart_phase'] = (phase + len(new_df)) % stride
+    state['chart_points'] += len(new_points)
+
+    # add_rows never drops points, so redraw from the trimmed history now and then
+    if state['chart_points'] > 2 * CHART_POINTS:
+        return False
+    if not new_points.empty:
+        chart.add_rows(**{CHART_DATASET: new_points})
+    return True
+
+@st.fragment(run_every=1.0)
+def live_panel():
+    """Add the data streamed since the last run and show the latest, highest and lowest temperature."""
+    state = st.session_state
+    new_df = build_temperature_frame(read_temperature_events(state['events'], state['last_key']))
+    if append_temperature_data(state, new_df):
+        # Send only the new rows to the chart already in the browser; a full rerun redraws it
+        if state['chart'] is None or not update_temperature_chart(state, state['chart'], new_df):
+            st.rerun()
+
+    df = state['df']
+    if df is None:
+        return
+
+    # Update latest temperature and timestamp
+    latest_temp = df.iloc[-1]["Temperature"]
+    latest_time, _ = format_timestamp(state['last_key'])
+    # Find highest and lowest temperature within the HISTORY_WINDOW kept in memory
+    highest_idx = df['Temperature'].idxmax()
+    lowest_idx = df['Temperature'].idxmin()
+    highest_temp = df.at[highest_idx, 'Temperature']
+    lowest_temp = df.at[lowest_idx, 'Temperature']
+    highest_temp_time = df.at[highest_idx, 'Timestamp'].strftime(TIME_FORMAT)
+    lowest_temp_time = df.at[lowest_idx, 'Timestamp'].strftime(TIME_FORMAT)
+
+    st.metric(f"Latest Temperature (recorded at {latest_time})", f"{latest_temp:.2f} °C")
+    st.metric(f"Highest Temperature, {HISTORY_LABEL} (at {highest_temp_time})", f"{highest_temp:.2f} °C")
+    st.metric(f"Lowest Temperature, {HISTORY_LABEL} (at {lowest_temp_time})", f"{lowest_temp:.2f} °C")
+
 def filter_data_by_datetime_range(df, start_date, start_time, end_date, end_time):
     """Filter data by the user-defined date and time range."""
     # Create timezone-aware datetime objects
     start_datetime = datetime.combine(start_date, start_time).replace(tzinfo=timezone.utc)
     end_datetime = datetime.combine(end_date, end_time).replace(tzinfo=timezone.utc)
-    
-    return df[(df['Timestamp'] >= start_datetime) & (df['Timestamp'] <= end_datetime)]
+
+    # Timestamps are kept in ascending order, so the range can be cut by binary search
+    start_idx = df['Timestamp'].searchsorted(start_datetime, side='left')
+    end_idx = df['Timestamp'].searchsorted(end_datetime, side='right')
+    recent_df = df.iloc[start_idx:end_idx]
+    first_datetime = df['Timestamp'].iat[0]
+    if start_datetime >= first_datetime:
+        return recent_df
+
+    # The session only keeps HISTORY_WINDOW, so only the part before it is fetched
+    # from Firebase; the cached result then never covers samples still arriving
+    old_end_key = min(int(end_datetime.timestamp()), int(first_datetime.timestamp()) - 1)
+    try:
+        old_df = fetch_temperature_range(int(start_datetime.timestamp()), old_end_key)
+    except (aiohttp.ClientError, asyncio.TimeoutError, google.auth.exceptions.GoogleAuthError) as e:
+        # Keep the rest of the page working and offer what the session already holds
+        st.error(f"Could not fetch temperature data older than {first_datetime.strftime(TIME_FORMAT)}: {str(e)}")
+        return recent_df
+    if old_df is None:
+        return recent_df
+    return pd.concat([old_df, recent_df], ignore_index=True)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_csv(_filtered_df, last_key, time_range):
+    """Encode the filtered data as CSV bytes.
+
+    The DataFrame is not hashed; last_key and time_range identify it in the cache.
+    """
+    csv_df = pd.DataFrame({
+        'FormattedTime': _filtered_df['Timestamp'].dt.strftime(TIME_FORMAT),
+        'Temperature': _filtered_df['Temperature']
+    })
+    # Write straight to a bytes buffer instead of building a str and encoding it
+    buffer = io.BytesIO()
+    csv_df.to_csv(buffer, index=False, lineterminator='\n', encoding='utf-8')
+    return buffer.getvalue()
 
 def main():
-    global df  # Use the global DataFrame to store data
     st.set_page_config(page_title="NanoTemp", page_icon="🧊", layout="centered")
     # Initialize Streamlit UI
     st.title('NanoTemp IIT')
@@ -88,14 +402,37 @@ def main():
 
     
     # Initialize Firebase
-    initialize_firebase()
+    try:
+        get_firebase_app()
+    except Exception as e:
+        st.error(f"Firebase initialization error: {str(e)}")
+        st.stop()
 
-    # Create placeholders for updating components
-    chart_placeholder = st.empty()
-    latest_temp_placeholder = st.empty()
-    latest_time_placeholder = st.empty()
-    highest_temp_placeholder = st.empty()
-    lowest_temp_placeholder = st.empty()
+    # Keep the fetched data in this session's state so sessions never share it
+    st.session_state.setdefault('df', None)
+    st.session_state.setdefault('last_key', None)
+    if 'events' not in st.session_state:
+        # Subscribe before reading the latest key so no sample falls between the
+        # cached history and the queue
+        listener = get_listener()
+        events = listener.subscribe()
+        append_temperature_data(st.session_state, load_temperature_history(listener.latest_key))
+        # Only mark the session as loaded once the history is in, so a failed load
+        # is retried on the next rerun
+        st.session_state['events'] = events
+    df = st.session_state['df']
+
+    # Draw the chart once per script run; live_panel() catches up on queued
+    # samples and only appends to it
+    st.session_state['chart'] = None
+    if df is not None:
+        st.session_state['chart'] = draw_temperature_chart(st.session_state, df)
+
+    # Reruns every second on its own, without rerunning the rest of the page
+    live_panel()
+    # live_panel() may have appended samples; read the data and its last key together
+    df = st.session_state['df']
+    last_key = st.session_state['last_key']
 
     # Download section
     st.header('Download Temperature Data')
@@ -120,39 +457,16 @@ def main():
         st.session_state['end_date'] = st.date_input("End Date", value=st.session_state['end_date'])
         st.session_state['end_time'] = st.time_input('End Time', value=st.session_state['end_time'])
 
-    # Only fetch the data once when needed
-    if df is None:
-        df = fetch_temperature_data()
-
     # Main data display and download logic
     if df is not None:
-        # Update latest temperature and timestamp
-        latest_temp = df.iloc[-1]["Temperature"]
-        latest_time = df.iloc[-1]["FormattedTime"]
-        # Find highest and lowest temperature
-        highest_temp = df['Temperature'].max()
-        lowest_temp = df['Temperature'].min()
-        highest_temp_time = df[df['Temperature'] == highest_temp]['FormattedTime'].values[0]
-        lowest_temp_time = df[df['Temperature'] == lowest_temp]['FormattedTime'].values[0]
-
-        latest_temp_placeholder.markdown(f"<h3 style='font-size:30px;'>**Latest Temperature:** {latest_temp} °C</h3>", unsafe_allow_html=True)
-        latest_time_placeholder.write(f"**Recorded at:** {latest_time}")
-        highest_temp_placeholder.markdown(f"<h3 style='font-size:30px;'>**Highest Temperature:** {highest_temp} °C Recorded at {highest_temp_time}</h3>", unsafe_allow_html=True)
-        lowest_temp_placeholder.markdown(f"<h3 style='color:blue; font-size:30px;'>**Lowest Temperature:** {lowest_temp} °C (Recorded at {lowest_temp_time})</h3>", unsafe_allow_html=True)
-
-        # Update chart
-        chart = create_temperature_chart(df)
-        chart_placeholder.altair_chart(chart, use_container_width=True)
-
         # Handle data download
         if st.session_state['start_date'] and st.session_state['end_date'] and st.session_state['start_time'] and st.session_state['end_time']:
-            filtered_df = filter_data_by_datetime_range(
-                df, st.session_state['start_date'], st.session_state['start_time'], st.session_state['end_date'], st.session_state['end_time']
-            )
+            time_range = (st.session_state['start_date'], st.session_state['start_time'], st.session_state['end_date'], st.session_state['end_time'])
+            filtered_df = filter_data_by_datetime_range(df, *time_range)
             if not filtered_df.empty:
                 st.download_button(
                     label="Download Raw Data as CSV",
-                    data=filtered_df[['FormattedTime', 'Temperature']].to_csv(index=False),
+                    data=build_csv(filtered_df, last_key, time_range),
                     file_name=f"temperature_data_{st.session_state['start_date']}_{st.session_state['end_date']}.csv",
                     mime="text/csv"
                 )
@@ -161,57 +475,8 @@ def main():
                 st.write("No data available for the selected time range.")
 
 
-    footer = f"""
-    <style>
-        /* Footer container */
-        .footer {{
-            width: 100%;
-            background-color: #252525;
-            padding: 1rem;
-            text-align: center;
-            box-shadow: 0 -1px 5px rgba(0,0,0,0.1);
-            font-size: clamp(12px, 1vw, 16px);  /* Responsive font size */
-            color: #666;
-            position: fixed;
-            bottom: 0;
-            left: 0;
-        }}
-
-        /* Footer text */
-        .footer-text {{
-            color: #FFFFFF;
-            font-weight: 400;
-            font-size: clamp(16px, 1vw, 14px); /* Responsive font size */
-        }}
-    </style>
-
-    <div class="footer">
-        <div class="footer-text">
-            From Bolzaneto with ❤️!
-        </div>
-    </div>
-    """
     # Insert the footer in the Streamlit app
-    st.markdown(footer, unsafe_allow_html=True)
-
- # Main data display and download logic
-
-    while True:
-        df = fetch_temperature_data()
-        if df is not None:
-            # Update latest temperature and timestamp
-            latest_temp = df.iloc[-1]["Temperature"]
-            latest_time = df.iloc[-1]["FormattedTime"]
-            latest_temp_placeholder.write(f"**Latest Temperature:** {latest_temp} °C")
-            latest_time_placeholder.write(f"**Recorded at:** {latest_time}")
-            highest_temp_placeholder.markdown(f"**Highest Temperature:** <span style='color:red;'>**{highest_temp}** °C</span> at {highest_temp_time}", unsafe_allow_html=True)
-            lowest_temp_placeholder.write(f"**Lowest Temperature:** <span style='color:#00FFFF;'>**{lowest_temp}** °C</span> at {lowest_temp_time}", unsafe_allow_html=True)
-            # Update chart
-            chart = create_temperature_chart(df)
-            chart_placeholder.altair_chart(chart, use_container_width=True)
-            time.sleep(1)  # Pause for 1 second before updating again
-
-
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":